@@ -13,8 +13,8 @@ class Settings(BaseSettings):
 
     # Telnyx
     TELNYX_API_KEY: str | None = None
-    TELNYX_SIGNING_SECRET: str | None = None  # for webhook signature verification
-    TELNYX_PUBLIC_KEY: str | None = None  # for webhook signature verification (if different)
+    TELNYX_SIGNING_SECRET: str | None = None  # unused; v2 webhooks are verified with the public key
+    TELNYX_PUBLIC_KEY: str | None = None  # base64 Ed25519 key for webhook signature verification
 
     # OpenAI
     OPENAI_API_KEY: str | None = None
@@ -0,0 +1,24 @@
+"""Logging helpers."""
+from typing import Any
+
+import orjson
+
+
+class LazyJSON:
+    """Defer JSON serialization of a log argument until the record is emitted.
+
+    Pass as a ``%s`` argument, e.g. ``logger.debug("payload: %s", LazyJSON(payload))``;
+    when the level is filtered out the object is never encoded. Raw JSON bytes
+    are accepted too and are only parsed for pretty-printing when emitted.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        obj = self.obj
+        if isinstance(obj, (bytes, bytearray)):
+            obj = orjson.loads(obj)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
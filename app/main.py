@@ -1,20 +1,74 @@
+import atexit
 import logging
-from datetime import datetime
+import queue
+import time
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
+import httpx
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.routers.ai_voice import chat_router, chat_router_no_prefix, router as telnyx_router
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+# Configure logging: handlers on the event loop only enqueue records, and a
+# background listener thread does the actual (blocking) writes to stderr
+log_queue: queue.Queue = queue.Queue(-1)
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(QueueHandler(log_queue))
+listener.start()
+atexit.register(listener.stop)
+
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="AI Appointment Setter")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create app-lifetime resources on startup and release them on shutdown."""
+    # Shared client for outbound Telnyx API calls; keeps connections alive
+    # across webhook events instead of a new TCP+TLS handshake per call
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=50),
+    )
+    # Shared client for the OpenAI chat completions proxy (voice hot path);
+    # HTTP/2 lets concurrent calls multiplex over one TLS connection
+    app.state.openai = httpx.AsyncClient(
+        base_url="https://api.openai.com",
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=3.0, read=30.0),
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0,
+        ),
+    )
+    try:
+        yield
+    finally:
+        await app.state.openai.aclose()
+        await app.state.http.aclose()
+
+
+app = FastAPI(
+    title="AI Appointment Setter",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Endpoints whose request bodies are logged at DEBUG level
+CHAT_PATHS = frozenset({"/chat/completions", "/v1/chat/completions"})
 
 
 # Global exception handlers
@@ -22,7 +76,7 @@ app = FastAPI(title="AI Appointment Setter")
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle Pydantic validation errors with detailed logging."""
     logger.error(f"Validation error on {request.method} {request.url.path}: {exc.errors()}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": exc.errors(),
@@ -35,7 +89,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def global_exception_handler(request: Request, exc: Exception):
     """Catch-all exception handler for unexpected errors."""
     logger.error(f"Unhandled exception on {request.method} {request.url.path}: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -44,41 +98,74 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+_HEALTH_BYTES = orjson.dumps({"ok": True, "service": "AI Appointment Setter"})
+
+
 @app.get("/health")
 async def health():
-    return {"ok": True, "service": "AI Appointment Setter"}
-
-
-# Log all incoming requests
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming HTTP requests with detailed information."""
-    start_time = datetime.now()
-    
-    # Log request
-    logger.info(f"📥 {request.method} {request.url.path} - Client: {request.client.host if request.client else 'unknown'}")
-    
-    # Log request body for important endpoints
-    if request.url.path in ["/chat/completions", "/v1/chat/completions"]:
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+class AccessLogMiddleware:
+    """Log all incoming HTTP requests with status code and duration.
+
+    Implemented as a pure ASGI middleware so the response body streams straight
+    through; the status code is read from the ``http.response.start`` message.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
+        status_code = 500
+
+        # Log request
+        logger.info("📥 %s %s - Client: %s", method, path, client_host)
+
+        # Log request body for important endpoints as it is read by the handler;
+        # leave receive untouched unless the debug line would actually be emitted
+        if path in CHAT_PATHS and logger.isEnabledFor(logging.DEBUG):
+            inner_receive = receive
+
+            async def receive() -> Message:
+                message = await inner_receive()
+                if message["type"] == "http.request":
+                    body = message.get("body", b"")
+                    logger.debug(
+                        "Request body: %s", body[:500].decode(errors="replace") if body else "empty"
+                    )
+                return message
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         try:
-            body = await request.body()
-            logger.debug(f"Request body: {body[:500].decode() if body else 'empty'}")
-            # Create a new request with the body
-            async def receive():
-                return {"type": "http.request", "body": body}
-            request._receive = receive
-        except Exception as e:
-            logger.warning(f"Could not log request body: {e}")
-    
-    # Process request
-    response = await call_next(request)
-    
-    # Log response
-    duration = (datetime.now() - start_time).total_seconds()
-    logger.info(f"📤 {request.method} {request.url.path} - Status: {response.status_code} - Duration: {duration:.3f}s")
-    
-    return response
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Log response
+            duration = time.perf_counter() - start
+            logger.info(
+                "📤 %s %s - Status: %d - Duration: %.1fms",
+                method,
+                path,
+                status_code,
+                duration * 1000,
+            )
+
 
+app.add_middleware(AccessLogMiddleware)
 
 # Mount routers
 app.include_router(telnyx_router)
@@ -1,38 +1,88 @@
-import json
+import base64
+import functools
 import logging
+import time
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+from starlette.background import BackgroundTask
 
 from app.core.config import settings
-from app.services.persona_service import persona_manager
+from app.core.log_utils import LazyJSON
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Bound logger methods for the call-control path, which logs on every event.
+# Level checks stay inside the methods (Logger caches them), since the root
+# level is only configured after this module is imported.
+_log_info = logger.info
+_log_debug = logger.debug
+_log_error = logger.error
+
 router = APIRouter(prefix="/telnyx", tags=["voice", "telnyx"])
 
+# Settings are fixed once the process has started; bind the ones read on the
+# request path to module globals so handlers skip the attribute lookup on `settings`
+PERSONA_NAME = settings.PERSONA_NAME
+BUSINESS_NAME = settings.BUSINESS_NAME
+OPENAI_MODEL = settings.OPENAI_MODEL
+OPENAI_API_KEY = settings.OPENAI_API_KEY
+TELNYX_API_KEY = settings.TELNYX_API_KEY
+
+# Telnyx v2 webhooks are signed with Ed25519 over f"{telnyx-timestamp}|{body}"; the
+# base64 public key is shown in the Telnyx Portal (Account Settings > Keys)
+TELNYX_VERIFY_KEY = (
+    VerifyKey(base64.b64decode(settings.TELNYX_PUBLIC_KEY))
+    if settings.TELNYX_PUBLIC_KEY
+    else None
+)
+TELNYX_SIGNATURE_HEADER = "telnyx-signature-ed25519"
+TELNYX_TIMESTAMP_HEADER = "telnyx-timestamp"
+# Maximum age (seconds) of a signed webhook, to limit replays
+TELNYX_TIMESTAMP_TOLERANCE = 300
+
+
+# Static response bodies, serialized once at import (settings don't change at runtime)
+_STATUS_BYTES = orjson.dumps({
+    "status": "ready",
+    "service": "AI Appointment Setter",
+    "endpoints": {
+        "call_control": "/telnyx/call-control",
+        "ai_webhook": "/telnyx/ai",
+    },
+    "configuration": {
+        "persona": PERSONA_NAME,
+        "business": BUSINESS_NAME,
+        "model": OPENAI_MODEL,
+    }
+})
+
+_AI_PLACEHOLDER_BYTES = orjson.dumps({
+    "type": "message",
+    "role": "assistant",
+    "content": [
+        {
+            "type": "output_text",
+            "text": "Hi! I can help you book, reschedule, or cancel an appointment. What service do you need and when?",
+        }
+    ],
+})
+
 
 @router.get("/status")
 async def telnyx_status():
     """Status endpoint to verify Telnyx webhook configuration."""
-    return JSONResponse({
-        "status": "ready",
-        "service": "AI Appointment Setter",
-        "endpoints": {
-            "call_control": "/telnyx/call-control",
-            "ai_webhook": "/telnyx/ai",
-        },
-        "configuration": {
-            "persona": settings.PERSONA_NAME,
-            "business": settings.BUSINESS_NAME,
-            "model": settings.OPENAI_MODEL,
-        }
-    })
+    return Response(content=_STATUS_BYTES, media_type="application/json")
 
 
 @router.post("/diagnostic")
@@ -43,36 +93,65 @@ async def diagnostic_endpoint(request: Request):
     """
     try:
         body = await request.body()
-        headers = dict(request.headers)
-        
-        logger.info("=" * 80)
-        logger.info("🔍 DIAGNOSTIC REQUEST RECEIVED")
-        logger.info(f"Method: {request.method}")
-        logger.info(f"Path: {request.url.path}")
-        logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        logger.info(f"Body (raw): {body.decode('utf-8')}")
-        
-        try:
-            json_body = json.loads(body)
-            logger.info(f"Body (parsed JSON): {json.dumps(json_body, indent=2)}")
-        except:
-            logger.info("Body is not valid JSON")
-        
-        logger.info("=" * 80)
-        
-        return JSONResponse({
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 80)
+            logger.info("🔍 DIAGNOSTIC REQUEST RECEIVED")
+            logger.info("Method: %s", request.method)
+            logger.info("Path: %s", request.url.path)
+            logger.info("Headers: %s", LazyJSON(dict(request.headers)))
+
+            # Parse once; bodies are capped in the log since this endpoint is unauthenticated
+            try:
+                logger.info("Body (parsed JSON): %.2048s", LazyJSON(orjson.loads(body)))
+            except orjson.JSONDecodeError:
+                logger.info(
+                    "Body (raw, non-JSON): %s", body[:2048].decode("utf-8", errors="replace")
+                )
+
+            logger.info("=" * 80)
+
+        return {
             "diagnostic": "received",
             "method": request.method,
             "path": str(request.url.path),
             "body_length": len(body),
-        })
+        }
     except Exception as e:
-        logger.error(f"Diagnostic endpoint error: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        logger.error("Diagnostic endpoint error: %s", e)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
+
+
+async def verify_telnyx(request: Request) -> bytes:
+    """Read the raw webhook body and verify its signature before any parsing.
+
+    When TELNYX_PUBLIC_KEY is set, the Ed25519 signature header must verify over
+    ``f"{timestamp}|{body}"`` and the timestamp must be within
+    TELNYX_TIMESTAMP_TOLERANCE seconds of now; otherwise the request is rejected
+    with 401 before any JSON work is done. The body is returned and cached on
+    ``request.state.body``.
+    """
+    body = await request.body()
+
+    if TELNYX_VERIFY_KEY is not None:
+        signature = request.headers.get(TELNYX_SIGNATURE_HEADER, "")
+        timestamp = request.headers.get(TELNYX_TIMESTAMP_HEADER, "")
+        try:
+            if abs(time.time() - int(timestamp)) > TELNYX_TIMESTAMP_TOLERANCE:
+                raise ValueError("stale timestamp")
+            TELNYX_VERIFY_KEY.verify(
+                timestamp.encode() + b"|" + body, base64.b64decode(signature, validate=True)
+            )
+        except (ValueError, BadSignatureError):
+            logger.warning("Rejected Telnyx webhook with invalid signature on %s", request.url.path)
+            raise HTTPException(status_code=401, detail="Invalid webhook signature") from None
+
+    request.state.body = body
+    return body
 
 
 @router.post("/ai")
-async def telnyx_ai_webhook(request: Request):
+async def telnyx_ai_webhook(body: bytes = Depends(verify_telnyx)):
     """Webhook endpoint for Telnyx AI Assistant events (Custom LLM mode).
 
     Notes
@@ -81,38 +160,123 @@ async def telnyx_ai_webhook(request: Request):
       Some setups may forward conversational turns via a webhook style callback
       that resembles OpenAI's Responses API contract. Until finalized, we accept
       the payload and return a placeholder.
-    - We'll validate signatures when TELNYX_SIGNING_SECRET is provided.
+    - Signatures are validated by ``verify_telnyx`` when TELNYX_PUBLIC_KEY
+      is provided.
     """
     try:
-        payload = await request.json()
-        logger.info(f"Received Telnyx AI webhook event: {payload.get('event_type', 'unknown')}")
-        logger.debug(f"Telnyx payload: {json.dumps(payload, indent=2)}")
+        payload = orjson.loads(body)
+        logger.info("Received Telnyx AI webhook event: %s", payload.get("event_type", "unknown"))
+        logger.debug("Telnyx payload: %s", LazyJSON(payload))
     except Exception as exc:  # noqa: BLE001
-        logger.error(f"Invalid JSON in Telnyx webhook: {exc}")
+        logger.error("Invalid JSON in Telnyx webhook: %s", exc)
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {exc}")
 
-    # TODO: verify Telnyx signature when signing secret is present
-    # signing_secret = settings.TELNYX_SIGNING_SECRET
-    # if signing_secret:
-    #     verify_signature(request, signing_secret)
-
     # For now, respond with a simple instruction.
-    return JSONResponse(
-        {
-            "type": "message",
-            "role": "assistant",
-            "content": [
-                {
-                    "type": "output_text",
-                    "text": "Hi! I can help you book, reschedule, or cancel an appointment. What service do you need and when?",
-                }
-            ],
-        }
+    return Response(content=_AI_PLACEHOLDER_BYTES, media_type="application/json")
+
+
+# Pydantic models for Telnyx Call Control webhooks (only the fields we read).
+# These events are only logged, so the models are lenient: numbers are accepted
+# for string fields and nulls fall back to defaults rather than failing with a
+# 400, which Telnyx would retry.
+class TelnyxCallPayload(BaseModel):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    call_control_id: str | None = None
+    call_leg_id: str | None = None
+    from_: str | None = Field(default=None, alias="from")
+    to: str | list[str] | None = None
+    direction: str | None = None
+    hangup_cause: str | None = None
+    hangup_source: str | None = None
+    result: str | None = None
+    reason: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+class TelnyxEventData(BaseModel):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    event_type: str = "unknown"
+    payload: TelnyxCallPayload = Field(default_factory=TelnyxCallPayload)
+
+    @field_validator("event_type", mode="before")
+    @classmethod
+    def _null_event_type(cls, value: Any) -> Any:
+        return "unknown" if value is None else value
+
+    @field_validator("payload", mode="before")
+    @classmethod
+    def _null_payload(cls, value: Any) -> Any:
+        return {} if value is None else value
+
+
+class TelnyxEvent(BaseModel):
+    data: TelnyxEventData = Field(default_factory=TelnyxEventData)
+
+    @field_validator("data", mode="before")
+    @classmethod
+    def _null_data(cls, value: Any) -> Any:
+        return {} if value is None else value
+
+
+# Per-event logging for Telnyx Call Control webhooks, keyed by event_type
+def _log_call_initiated(payload: TelnyxCallPayload) -> None:
+    _log_info("📲 New %s call: %s → %s", payload.direction, payload.from_, payload.to)
+
+
+def _log_call_answered(payload: TelnyxCallPayload) -> None:
+    _log_info("✅ Call answered: %s", payload.call_control_id)
+
+
+def _log_call_hangup(payload: TelnyxCallPayload) -> None:
+    _log_info(
+        "📴 Call ended: %s | Cause: %s | Source: %s",
+        payload.call_control_id,
+        payload.hangup_cause or "unknown",
+        payload.hangup_source or "unknown",
     )
 
 
+def _log_machine_detection(payload: TelnyxCallPayload) -> None:
+    _log_info("🤖 Machine detection: %s", payload.result or "unknown")
+
+
+def _log_ai_started(payload: TelnyxCallPayload) -> None:
+    _log_info("🤖 AI Assistant activated for call: %s", payload.call_control_id)
+
+
+def _log_ai_ended(payload: TelnyxCallPayload) -> None:
+    _log_info(
+        "🤖 AI Assistant ended: %s | Reason: %s",
+        payload.call_control_id,
+        payload.reason or "unknown",
+    )
+
+
+def _log_ai_error(payload: TelnyxCallPayload) -> None:
+    _log_error(
+        "❌ AI Assistant error: %s - %s",
+        payload.error_code or "unknown",
+        payload.error_message or "unknown",
+    )
+
+
+_EVENT_HANDLERS: dict[str, Callable[[TelnyxCallPayload], None]] = {
+    "call.initiated": _log_call_initiated,
+    "call.answered": _log_call_answered,
+    "call.hangup": _log_call_hangup,
+    "call.machine.detection.ended": _log_machine_detection,
+    "call.ai.started": _log_ai_started,
+    "call.ai.ready": _log_ai_started,
+    "call.ai.ended": _log_ai_ended,
+    "call.ai.error": _log_ai_error,
+}
+
+
 @router.post("/call-control")
-async def telnyx_call_control(request: Request):
+async def telnyx_call_control(request: Request, body: bytes = Depends(verify_telnyx)):
     """Webhook endpoint for Telnyx Call Control events.
     
     IMPORTANT: If you're using Telnyx AI Assistant (Custom LLM):
@@ -123,70 +287,83 @@ async def telnyx_call_control(request: Request):
     If NOT using AI Assistant:
     - Uncomment the manual answer logic below
     """
+    # Decode and validate straight from the raw bytes in one pass (pydantic-core)
     try:
-        event = await request.json()
-    except Exception as exc:
-        logger.error(f"Invalid JSON in call control webhook: {exc}")
-        raise HTTPException(status_code=400, detail=f"Invalid JSON: {exc}")
-    
-    event_type = event.get("data", {}).get("event_type", "unknown")
-    payload = event.get("data", {}).get("payload", {})
-    call_control_id = payload.get("call_control_id")
-    call_leg_id = payload.get("call_leg_id")
-    
-    logger.info(f"📞 Telnyx Event: {event_type} | Call ID: {call_control_id}")
-    logger.debug(f"Full event payload: {json.dumps(event, indent=2)}")
+        event = TelnyxEvent.model_validate_json(body)
+    except ValidationError as exc:
+        # Full error (which includes the input) goes to the log, not the caller
+        _log_error("Invalid call control webhook payload: %s", exc)
+        raise HTTPException(status_code=400, detail="Invalid payload") from exc
+
+    event_type = event.data.event_type
+    payload = event.data.payload
+    call_control_id = payload.call_control_id
+
+    _log_info("📞 Telnyx Event: %s | Call ID: %s", event_type, call_control_id)
+    _log_debug("Full event payload: %s", LazyJSON(body))
     
     # Log important call events
-    if event_type == "call.initiated":
-        from_number = payload.get("from")
-        to_number = payload.get("to")
-        direction = payload.get("direction")
-        logger.info(f"📲 New {direction} call: {from_number} → {to_number}")
-        
-        # ⚠️ ONLY use manual answer if AI Assistant is NOT enabled in Telnyx Portal
-        # Uncomment the block below ONLY if you're NOT using AI Assistant:
-        
-        # logger.info(f"Manually answering call: {call_control_id}")
-        # async with httpx.AsyncClient(timeout=10.0) as client:
-        #     try:
-        #         answer_response = await client.post(
-        #             f"https://api.telnyx.com/v2/calls/{call_control_id}/actions/answer",
-        #             headers={
-        #                 "Authorization": f"Bearer {settings.TELNYX_API_KEY}",
-        #                 "Content-Type": "application/json",
-        #             },
-        #         )
-        #         answer_response.raise_for_status()
-        #         logger.info(f"✅ Successfully answered call: {call_control_id}")
-        #     except Exception as e:
-        #         logger.error(f"❌ Failed to answer call: {str(e)}")
-    
-    elif event_type == "call.answered":
-        logger.info(f"✅ Call answered: {call_control_id}")
-    
-    elif event_type == "call.hangup":
-        hangup_cause = payload.get("hangup_cause", "unknown")
-        hangup_source = payload.get("hangup_source", "unknown")
-        logger.info(f"📴 Call ended: {call_control_id} | Cause: {hangup_cause} | Source: {hangup_source}")
-    
-    elif event_type == "call.machine.detection.ended":
-        result = payload.get("result", "unknown")
-        logger.info(f"🤖 Machine detection: {result}")
-    
-    elif event_type in ["call.ai.started", "call.ai.ready"]:
-        logger.info(f"🤖 AI Assistant activated for call: {call_control_id}")
-    
-    elif event_type == "call.ai.ended":
-        reason = payload.get("reason", "unknown")
-        logger.info(f"🤖 AI Assistant ended: {call_control_id} | Reason: {reason}")
-    
-    elif event_type == "call.ai.error":
-        error_code = payload.get("error_code", "unknown")
-        error_message = payload.get("error_message", "unknown")
-        logger.error(f"❌ AI Assistant error: {error_code} - {error_message}")
-    
-    return JSONResponse({"received": True, "event_type": event_type})
+    handler = _EVENT_HANDLERS.get(event_type)
+    if handler:
+        handler(payload)
+
+    # ⚠️ ONLY use manual answer if AI Assistant is NOT enabled in Telnyx Portal
+    # Uncomment the block below ONLY if you're NOT using AI Assistant:
+
+    # if event_type == "call.initiated":
+    #     _log_info("Manually answering call: %s", call_control_id)
+    #     try:
+    #         answer_response = await request.app.state.http.post(
+    #             f"https://api.telnyx.com/v2/calls/{call_control_id}/actions/answer",
+    #             headers={
+    #                 "Authorization": f"Bearer {TELNYX_API_KEY}",
+    #                 "Content-Type": "application/json",
+    #             },
+    #         )
+    #         answer_response.raise_for_status()
+    #         _log_info("✅ Successfully answered call: %s", call_control_id)
+    #     except Exception as e:
+    #         _log_error("❌ Failed to answer call: %s", e)
+
+    return {"received": True, "event_type": event_type}
+
+
+@functools.cache
+def _get_persona_manager():
+    """Return the persona manager, importing it on first use.
+
+    Keeps persona_service out of startup for processes that only serve
+    /health and the Telnyx webhooks.
+    """
+    from app.services.persona_service import persona_manager
+
+    return persona_manager
+
+
+@functools.lru_cache(maxsize=1)
+def _clock_strings(minute: int) -> tuple[str, str]:
+    """Return the persona (current_date, current_time) strings for a minute bucket."""
+    now = datetime.fromtimestamp(minute * 60)
+    return now.strftime("%A, %B %d, %Y"), now.strftime("%I:%M %p")
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_system_prompt(
+    persona_name: str, business_name: str, current_date: str, current_time: str
+) -> str:
+    """Build the persona system prompt, memoized per date/minute.
+
+    The only inputs that vary between requests are the formatted date and time,
+    which change once a minute, so the prompt is rebuilt at most once per minute.
+    """
+    return _get_persona_manager().get_system_prompt(
+        persona_name=persona_name,
+        business_name=business_name,
+        business_info={
+            "current_date": current_date,
+            "current_time": current_time,
+        },
+    )
 
 
 # ========================================================================
@@ -201,6 +378,12 @@ class ChatMessage(BaseModel):
     tool_call_id: str | None = None
     name: str | None = None
 
+    @field_validator("content", "tool_calls", "tool_call_id", "name")
+    @classmethod
+    def _empty_to_none(cls, value):
+        # Empty values are dropped when forwarding (OpenAI rejects e.g. tool_calls: [])
+        return value or None
+
 
 class ChatCompletionRequest(BaseModel):
     model: str = "gpt-4o-mini"
@@ -211,6 +394,40 @@ class ChatCompletionRequest(BaseModel):
     stream: bool = False
 
 
+# Greeting spoken at the start of a call. GREETING_PREFIX is prepended to the
+# model's reply to the caller's first message; GREETING_FULL is sent on its own
+# before the caller has said anything.
+GREETING_PREFIX = (
+    f"Hello! Thank you for calling {BUSINESS_NAME}. "
+    "This is Jordan, your appointment scheduling assistant. "
+)
+GREETING_FULL = GREETING_PREFIX + "How may I help you today?"
+
+# Greeting-only completion, encoded once; the quoted placeholders are replaced per
+# request. They precede the content, so replacing the first occurrence is safe.
+_GREETING_TEMPLATE = orjson.dumps({
+    "id": "__ID__",
+    "object": "chat.completion",
+    "created": "__CREATED__",
+    "model": "__MODEL__",
+    "choices": [
+        {
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": GREETING_FULL,
+            },
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {
+        "prompt_tokens": 50,
+        "completion_tokens": 30,
+        "total_tokens": 80,
+    },
+})
+
+
 # OpenAI-compatible router for Telnyx Custom LLM
 chat_router = APIRouter(prefix="/v1", tags=["openai-compatible"])
 
@@ -343,57 +560,145 @@ APPOINTMENT_TOOLS = [
     },
 ]
 
+# The tool definitions never change; encode them once and splice the bytes into
+# every outgoing request body instead of re-encoding ~3 KB of JSON per call
+APPOINTMENT_TOOLS_JSON = orjson.dumps(APPOINTMENT_TOOLS)
+
+
+def _encode_openai_payload(payload: dict[str, Any]) -> bytes:
+    """Encode an OpenAI request body with the pre-encoded tools prepended.
+
+    ``payload`` must be a non-empty dict and must not contain ``tools``.
+    """
+    return b'{"tools":' + APPOINTMENT_TOOLS_JSON + b"," + orjson.dumps(payload)[1:]
+
+
+# Mock tool implementations. Replace with real business logic.
+def _find_slots(arguments: dict[str, Any]) -> dict[str, Any]:
+    # Mock: Return some fake available slots
+    service = arguments.get("service_name", "service")
+    start_date = arguments.get("start_date")
+    return {
+        "success": True,
+        "slots": [
+            {"datetime": f"{start_date}T09:00:00", "staff": "Sarah"},
+            {"datetime": f"{start_date}T10:30:00", "staff": "Mike"},
+            {"datetime": f"{start_date}T14:00:00", "staff": "Sarah"},
+        ],
+        "message": f"Found 3 available slots for {service}",
+    }
+
+
+def _book(arguments: dict[str, Any]) -> dict[str, Any]:
+    # Mock: Confirm booking
+    customer = arguments.get("customer_name")
+    dt = arguments.get("appointment_datetime")
+    service = arguments.get("service_name")
+    return {
+        "success": True,
+        "appointment_id": "APT-12345",
+        "message": f"Successfully booked {service} for {customer} on {dt}",
+        "confirmation_sent": True,
+    }
+
+
+def _cancel(arguments: dict[str, Any]) -> dict[str, Any]:
+    phone = arguments.get("customer_phone")
+    return {
+        "success": True,
+        "message": f"Appointment for {phone} has been cancelled",
+    }
+
+
+def _reschedule(arguments: dict[str, Any]) -> dict[str, Any]:
+    new_dt = arguments.get("new_datetime")
+    return {
+        "success": True,
+        "message": f"Appointment rescheduled to {new_dt}",
+    }
+
+
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "find_available_slots": _find_slots,
+    "book_appointment": _book,
+    "cancel_appointment": _cancel,
+    "reschedule_appointment": _reschedule,
+}
+
+
+def _unknown_tool(tool_name: str) -> dict[str, Any]:
+    return {"success": False, "error": f"Unknown tool: {tool_name}"}
+
 
 def execute_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Execute a tool call and return results.
 
-    This is a mock implementation. Replace with real business logic.
+    Dispatches through ``_TOOL_HANDLERS``; register new tools there.
     """
-    if tool_name == "find_available_slots":
-        # Mock: Return some fake available slots
-        service = arguments.get("service_name", "service")
-        start_date = arguments.get("start_date")
-        return {
-            "success": True,
-            "slots": [
-                {"datetime": f"{start_date}T09:00:00", "staff": "Sarah"},
-                {"datetime": f"{start_date}T10:30:00", "staff": "Mike"},
-                {"datetime": f"{start_date}T14:00:00", "staff": "Sarah"},
-            ],
-            "message": f"Found 3 available slots for {service}",
-        }
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        return _unknown_tool(tool_name)
+    return handler(arguments)
 
-    if tool_name == "book_appointment":
-        # Mock: Confirm booking
-        customer = arguments.get("customer_name")
-        dt = arguments.get("appointment_datetime")
-        service = arguments.get("service_name")
-        return {
-            "success": True,
-            "appointment_id": "APT-12345",
-            "message": f"Successfully booked {service} for {customer} on {dt}",
-            "confirmation_sent": True,
-        }
 
-    if tool_name == "cancel_appointment":
-        phone = arguments.get("customer_phone")
-        return {
-            "success": True,
-            "message": f"Appointment for {phone} has been cancelled",
-        }
+_SSE_DONE = b"data: [DONE]\n\n"
 
-    if tool_name == "reschedule_appointment":
-        new_dt = arguments.get("new_datetime")
-        return {
-            "success": True,
-            "message": f"Appointment rescheduled to {new_dt}",
-        }
 
-    return {"success": False, "error": f"Unknown tool: {tool_name}"}
+def _sse_chunk(model: str, delta: dict[str, Any], finish_reason: str | None) -> bytes:
+    """Encode a single chat.completion.chunk SSE event."""
+    now = int(time.time())
+    chunk = {
+        "id": f"chatcmpl-{now}",
+        "object": "chat.completion.chunk",
+        "created": now,
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "delta": delta,
+                "finish_reason": finish_reason,
+            }
+        ],
+    }
+    return b"data: " + orjson.dumps(chunk) + b"\n\n"
+
+
+def _sse_content_chunk(model: str, content: str) -> bytes:
+    """Encode a single assistant content delta as a chat.completion.chunk SSE event."""
+    return _sse_chunk(model, {"role": "assistant", "content": content}, None)
+
+
+async def _relay_stream(
+    upstream: httpx.Response, model: str, greeting: str | None = None
+) -> AsyncIterator[bytes]:
+    """Forward an OpenAI SSE stream unchanged, optionally preceded by a greeting chunk."""
+    try:
+        if greeting:
+            yield _sse_content_chunk(model, greeting)
+        async for chunk in upstream.aiter_bytes():
+            yield chunk
+    finally:
+        await upstream.aclose()
+
+
+def _parse_chat_request(body: bytes) -> ChatCompletionRequest:
+    """Decode and validate a chat completion request from raw JSON bytes.
+
+    Validation errors are raised as RequestValidationError so they get the same
+    422 response as FastAPI's own body validation.
+    """
+    try:
+        return ChatCompletionRequest.model_validate_json(body)
+    except ValidationError as exc:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in exc.errors(include_url=False, include_input=False)
+        ]
+        raise RequestValidationError(errors, body=body.decode(errors="replace")) from exc
 
 
 @chat_router.post("/chat/completions")
-async def chat_completions(request: ChatCompletionRequest):
+async def chat_completions(http_request: Request):
     """OpenAI-compatible chat completions endpoint for Telnyx Custom LLM.
 
     This endpoint:
@@ -409,15 +714,24 @@ async def chat_completions(request: ChatCompletionRequest):
     - PERSONA_NAME: Which persona to load (default, medical_clinic, salon_spa)
     - BUSINESS_NAME: Your business name for context injection
     """
-    logger.info(f"🎙️ Received chat completion request for model: {request.model}")
-    logger.info(f"📝 Messages count: {len(request.messages)}")
+    # Parse + validate straight from the body bytes in one pydantic-core pass,
+    # instead of FastAPI's json.loads followed by model validation
+    request = _parse_chat_request(await http_request.body())
+
+    logger.info("🎙️ Received chat completion request for model: %s", request.model)
+    logger.info("📝 Messages count: %d", len(request.messages))
     
     # Log all messages for debugging
-    for i, msg in enumerate(request.messages):
-        content_preview = msg.content[:100] if msg.content else "None"
-        logger.info(f"   Message {i}: role={msg.role}, content={content_preview}")
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, msg in enumerate(request.messages):
+            logger.debug(
+                "   Message %d: role=%s, content=%.100s",
+                i,
+                msg.role,
+                msg.content or "None",
+            )
     
-    if not settings.OPENAI_API_KEY:
+    if not OPENAI_API_KEY:
         logger.error("OPENAI_API_KEY not configured")
         raise HTTPException(
             status_code=500,
@@ -431,203 +745,266 @@ async def chat_completions(request: ChatCompletionRequest):
     # 2. There's only ONE message and it's the "Use external LLM only." system message
     # 3. This is the VERY FIRST user message (no prior assistant messages in history)
     
-    user_messages = [msg for msg in request.messages if msg.role == "user" and msg.content and msg.content.strip()]
-    assistant_messages = [msg for msg in request.messages if msg.role == "assistant"]
+    # Count non-empty user turns and assistant turns in a single pass
+    n_user = n_assistant = 0
+    for msg in request.messages:
+        if msg.role == "user":
+            if msg.content and msg.content.strip():
+                n_user += 1
+        elif msg.role == "assistant":
+            n_assistant += 1
+
+    first_msg = request.messages[0] if request.messages else None
     has_only_system_instruction = (
-        len(request.messages) == 1 
-        and request.messages[0].role == "system" 
-        and "Use external LLM only" in (request.messages[0].content or "")
+        len(request.messages) == 1
+        and first_msg.role == "system"
+        and "Use external LLM only" in (first_msg.content or "")
     )
-    
+    is_first_user_turn = n_user == 1 and n_assistant == 0
+
     # First interaction if: no user messages, or first user message with no prior assistant responses
-    is_first_interaction = (
-        len(user_messages) == 0 
-        or has_only_system_instruction 
-        or (len(user_messages) == 1 and len(assistant_messages) == 0)
-    )
+    is_first_interaction = n_user == 0 or has_only_system_instruction or is_first_user_turn
     
     if is_first_interaction:
         logger.info("🎬 FIRST INTERACTION DETECTED - Prepending greeting to response")
         
         # For the very first user message, we'll process it with OpenAI 
         # but prepend the greeting to the response
-        if len(user_messages) == 1 and len(assistant_messages) == 0:
+        if is_first_user_turn:
             logger.info("📞 First user message detected - will add greeting before response")
             # Continue to OpenAI but we'll prepend greeting later
         else:
             # No user message yet - just send greeting
-            greeting_text = (
-                f"Hello! Thank you for calling {settings.BUSINESS_NAME}. "
-                f"This is Jordan, your appointment scheduling assistant. "
-                f"How may I help you today?"
+            logger.info("🗣️ Greeting: %s", GREETING_FULL)
+
+            if request.stream:
+                # Whole greeting as one delta, then the stop chunk and terminator
+                logger.info("✅ Greeting response streamed successfully")
+                return Response(
+                    content=(
+                        _sse_content_chunk(request.model, GREETING_FULL)
+                        + _sse_chunk(request.model, {}, "stop")
+                        + _SSE_DONE
+                    ),
+                    media_type="text/event-stream",
+                )
+
+            # Only id/created/model vary; patch them into the pre-encoded body
+            now = str(int(time.time())).encode()
+            body = (
+                _GREETING_TEMPLATE.replace(b'"__ID__"', b'"chatcmpl-' + now + b'"', 1)
+                .replace(b'"__CREATED__"', now, 1)
+                .replace(b'"__MODEL__"', orjson.dumps(request.model), 1)
             )
-            logger.info(f"🗣️ Greeting: {greeting_text}")
-            
-            response = {
-                "id": f"chatcmpl-{int(datetime.now().timestamp())}",
-                "object": "chat.completion",
-                "created": int(datetime.now().timestamp()),
-                "model": request.model,
-                "choices": [
-                    {
-                        "index": 0,
-                        "message": {
-                            "role": "assistant",
-                            "content": greeting_text,
-                        },
-                        "finish_reason": "stop",
-                    }
-                ],
-                "usage": {
-                    "prompt_tokens": 50,
-                    "completion_tokens": 30,
-                    "total_tokens": 80,
-                },
-            }
             logger.info("✅ Greeting response sent successfully")
-            return response
+            return Response(content=body, media_type="application/json")
 
     # Load and inject persona as system message
     try:
-        system_prompt = persona_manager.get_system_prompt(
-            persona_name=settings.PERSONA_NAME,
-            business_name=settings.BUSINESS_NAME,
-            business_info={
-                "current_date": datetime.now().strftime("%A, %B %d, %Y"),
-                "current_time": datetime.now().strftime("%I:%M %p"),
-            },
+        current_date, current_time = _clock_strings(int(time.time()) // 60)
+        system_prompt = _cached_system_prompt(
+            PERSONA_NAME, BUSINESS_NAME, current_date, current_time
         )
-        logger.debug(f"Loaded persona: {settings.PERSONA_NAME} for {settings.BUSINESS_NAME}")
+        logger.debug("Loaded persona: %s for %s", PERSONA_NAME, BUSINESS_NAME)
     except Exception as e:
-        logger.error(f"Failed to load persona: {e}")
+        logger.error("Failed to load persona: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to load persona configuration: {str(e)}",
         )
 
-    # Build messages with persona injection
-    messages = [{"role": "system", "content": system_prompt}]
-
-    # Add conversation history from request
-    for msg in request.messages:
-        message_dict = {"role": msg.role}
-
-        if msg.content:
-            message_dict["content"] = msg.content
-
-        if msg.tool_calls:
-            message_dict["tool_calls"] = msg.tool_calls
+    # Build messages with persona injection, followed by the conversation history
+    messages = [
+        {"role": "system", "content": system_prompt},
+        *(msg.model_dump(exclude_none=True) for msg in request.messages),
+    ]
 
-        if msg.tool_call_id:
-            message_dict["tool_call_id"] = msg.tool_call_id
-
-        if msg.name:
-            message_dict["name"] = msg.name
-
-        messages.append(message_dict)
-
-    # Prepare OpenAI API request
+    # Prepare OpenAI API request (tools are spliced in pre-encoded)
     openai_payload = {
-        "model": settings.OPENAI_MODEL,
+        "model": OPENAI_MODEL,
         "messages": messages,
-        "tools": APPOINTMENT_TOOLS,
         "temperature": request.temperature,
     }
 
     if request.max_tokens:
         openai_payload["max_tokens"] = request.max_tokens
 
-    # Call OpenAI
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            logger.info(f"Calling OpenAI API with model: {settings.OPENAI_MODEL}")
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json=openai_payload,
+    # Call OpenAI over the shared, connection-pooled client
+    client = http_request.app.state.openai
+    headers = {
+        "Authorization": f"Bearer {OPENAI_API_KEY}",
+        "Content-Type": "application/json",
+    }
+    try:
+        logger.info("Calling OpenAI API with model: %s", OPENAI_MODEL)
+
+        # Streaming: relay OpenAI's SSE chunks as they arrive so Telnyx can start
+        # TTS on the first token instead of waiting for the full completion
+        if request.stream:
+            openai_payload["stream"] = True
+            upstream = await client.send(
+                client.build_request(
+                    "POST",
+                    "/v1/chat/completions",
+                    headers=headers,
+                    content=_encode_openai_payload(openai_payload),
+                ),
+                stream=True,
             )
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"OpenAI request successful. Usage: {result.get('usage', {})}")
-            
-            # Validate response structure
-            if not result.get("choices") or len(result["choices"]) == 0:
-                logger.error(f"❌ OpenAI returned no choices: {result}")
-                raise HTTPException(
-                    status_code=500,
-                    detail="OpenAI returned invalid response structure (no choices)"
-                )
-            
-            # Get response content and validate
-            choice = result["choices"][0]
-            message = choice.get("message", {})
-            response_content = message.get("content", "")
-            
-            if not response_content:
-                logger.warning("⚠️ OpenAI returned empty content")
-                # Check if there are tool calls instead
-                if message.get("tool_calls"):
-                    logger.info(f"🔧 Tool calls present: {message['tool_calls']}")
-                else:
-                    logger.error("❌ No content and no tool calls in response")
-            else:
-                logger.info(f"🤖 OpenAI Response Content ({len(response_content)} chars): {response_content[:200]}...")
-            
-            # If this is the first user interaction, prepend greeting to the response
-            if len(user_messages) == 1 and len(assistant_messages) == 0:
-                logger.info("🎬 Prepending greeting to first response")
-                greeting = (
-                    f"Hello! Thank you for calling {settings.BUSINESS_NAME}. "
-                    f"This is Jordan, your appointment scheduling assistant. "
-                )
-                # Get the original response content
-                original_content = result["choices"][0]["message"]["content"] or ""
-                # Prepend greeting
-                result["choices"][0]["message"]["content"] = greeting + original_content
-                logger.info(f"✅ Greeting prepended. New length: {len(result['choices'][0]['message']['content'])} chars")
-            
-            # Log what we're sending back to Telnyx
-            final_content = result["choices"][0]["message"]["content"]
-            final_length = len(final_content) if final_content else 0
-            logger.info(f"📤 Sending to Telnyx ({final_length} chars): {final_content[:200]}...")
-            
-            # Log the full response structure for debugging
-            logger.debug(f"Full response structure: {json.dumps(result, indent=2)}")
-            
-            return result
-
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text
-            logger.error(f"OpenAI API error ({e.response.status_code}): {error_detail}")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"OpenAI API error: {error_detail}",
+            if upstream.is_error:
+                await upstream.aread()
+                await upstream.aclose()
+                upstream.raise_for_status()
+
+            greeting = None
+            if is_first_user_turn:
+                logger.info("🎬 Streaming greeting ahead of first response")
+                greeting = GREETING_PREFIX
+            # The generator closes upstream when it finishes; the background task
+            # also covers a client that disconnects before iteration starts
+            return StreamingResponse(
+                _relay_stream(upstream, request.model, greeting),
+                media_type="text/event-stream",
+                background=BackgroundTask(upstream.aclose),
             )
-        except httpx.TimeoutException:
-            logger.error("OpenAI API timeout")
-            raise HTTPException(
-                status_code=504,
-                detail="OpenAI API request timed out",
+
+        response = await client.post(
+            "/v1/chat/completions",
+            headers=headers,
+            content=_encode_openai_payload(openai_payload),
+        )
+        response.raise_for_status()
+        raw = response.content
+
+        # Nothing to modify and INFO logging is off (so none of the content /
+        # empty-response diagnostics below would be emitted): forward OpenAI's
+        # bytes as-is instead of parsing and re-encoding the completion
+        if not is_first_user_turn and not logger.isEnabledFor(logging.INFO):
+            return Response(
+                content=raw,
+                media_type="application/json",
+                status_code=response.status_code,
             )
-        except Exception as e:
-            logger.error(f"Unexpected error calling OpenAI: {str(e)}")
+
+        result = orjson.loads(raw)
+        logger.info("OpenAI request successful. Usage: %s", result.get("usage", {}))
+        
+        # Validate response structure
+        if not result.get("choices") or len(result["choices"]) == 0:
+            logger.error("❌ OpenAI returned no choices: %s", result)
             raise HTTPException(
                 status_code=500,
-                detail=f"Error calling OpenAI: {str(e)}",
+                detail="OpenAI returned invalid response structure (no choices)"
             )
+        
+        # Get response content and validate
+        choice = result["choices"][0]
+        message = choice.get("message", {})
+        response_content = message.get("content", "")
+        
+        if not response_content:
+            logger.warning("⚠️ OpenAI returned empty content")
+            # Check if there are tool calls instead
+            if message.get("tool_calls"):
+                logger.info("🔧 Tool calls present: %s", message["tool_calls"])
+            else:
+                logger.error("❌ No content and no tool calls in response")
+        else:
+            logger.info(
+                "🤖 OpenAI Response Content (%d chars): %.200s...",
+                len(response_content),
+                response_content,
+            )
+        
+        # If this is the first user interaction, prepend greeting to the response
+        if is_first_user_turn:
+            logger.info("🎬 Prepending greeting to first response")
+            greeting = GREETING_PREFIX
+            # Get the original response content
+            original_content = result["choices"][0]["message"]["content"] or ""
+            # Prepend greeting
+            result["choices"][0]["message"]["content"] = greeting + original_content
+            logger.info(
+                "✅ Greeting prepended. New length: %d chars",
+                len(result["choices"][0]["message"]["content"]),
+            )
+        
+        # Log what we're sending back to Telnyx
+        final_content = result["choices"][0]["message"]["content"]
+        final_length = len(final_content) if final_content else 0
+        logger.info("📤 Sending to Telnyx (%d chars): %.200s...", final_length, final_content)
+        
+        # Log the full response structure for debugging
+        logger.debug("Full response structure: %s", LazyJSON(result))
+        
+        return ORJSONResponse(result)
 
+    except httpx.HTTPStatusError as e:
+        error_detail = e.response.text
+        logger.error("OpenAI API error (%d): %s", e.response.status_code, error_detail)
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"OpenAI API error: {error_detail}",
+        )
+    except httpx.TimeoutException:
+        logger.error("OpenAI API timeout")
+        raise HTTPException(
+            status_code=504,
+            detail="OpenAI API request timed out",
+        )
+    except Exception as e:
+        logger.error("Unexpected error calling OpenAI: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error calling OpenAI: {str(e)}",
+        )
 
-@chat_router_no_prefix.post("/chat/completions")
-async def chat_completions_no_prefix(request: ChatCompletionRequest):
-    """Alternative endpoint for /chat/completions without /v1 prefix.
-    
-    This handles cases where Telnyx calls /chat/completions directly
-    instead of /v1/chat/completions.
-    """
-    return await chat_completions(request)
+
+# The models list is static apart from `created`, which Telnyx doesn't check;
+# encode it once with the process start time
+_MODELS_CREATED = int(time.time())
+_MODELS_BYTES = orjson.dumps({
+    "object": "list",
+    "data": [
+        {
+            "id": OPENAI_MODEL,
+            "object": "model",
+            "created": _MODELS_CREATED,
+            "owned_by": "openai",
+            "permission": [],
+            "root": OPENAI_MODEL,
+            "parent": None,
+        },
+        # Include common fallback models
+        {
+            "id": "gpt-4o-mini",
+            "object": "model",
+            "created": _MODELS_CREATED,
+            "owned_by": "openai",
+            "permission": [],
+            "root": "gpt-4o-mini",
+            "parent": None,
+        },
+        {
+            "id": "gpt-4o",
+            "object": "model",
+            "created": _MODELS_CREATED,
+            "owned_by": "openai",
+            "permission": [],
+            "root": "gpt-4o",
+            "parent": None,
+        },
+        {
+            "id": "gpt-4",
+            "object": "model",
+            "created": _MODELS_CREATED,
+            "owned_by": "openai",
+            "permission": [],
+            "root": "gpt-4",
+            "parent": None,
+        },
+    ],
+})
 
 
 @chat_router.get("/models")
@@ -637,57 +1014,10 @@ async def list_models():
     Returns available models in OpenAI format. Telnyx uses this to validate
     the Custom LLM configuration and check which models are available.
     """
-    current_time = int(datetime.now().timestamp())
-    
-    return {
-        "object": "list",
-        "data": [
-            {
-                "id": settings.OPENAI_MODEL,
-                "object": "model",
-                "created": current_time,
-                "owned_by": "openai",
-                "permission": [],
-                "root": settings.OPENAI_MODEL,
-                "parent": None,
-            },
-            # Include common fallback models
-            {
-                "id": "gpt-4o-mini",
-                "object": "model",
-                "created": current_time,
-                "owned_by": "openai",
-                "permission": [],
-                "root": "gpt-4o-mini",
-                "parent": None,
-            },
-            {
-                "id": "gpt-4o",
-                "object": "model",
-                "created": current_time,
-                "owned_by": "openai",
-                "permission": [],
-                "root": "gpt-4o",
-                "parent": None,
-            },
-            {
-                "id": "gpt-4",
-                "object": "model",
-                "created": current_time,
-                "owned_by": "openai",
-                "permission": [],
-                "root": "gpt-4",
-                "parent": None,
-            },
-        ],
-    }
+    return Response(content=_MODELS_BYTES, media_type="application/json")
 
 
-@chat_router_no_prefix.get("/models")
-async def list_models_no_prefix():
-    """Alternative endpoint for /models without /v1 prefix.
-    
-    This handles cases where Telnyx calls /models directly
-    instead of /v1/models.
-    """
-    return await list_models()
+# Telnyx may call /chat/completions and /models without the /v1 prefix; register
+# the same handlers directly rather than through wrapper endpoints
+chat_router_no_prefix.add_api_route("/chat/completions", chat_completions, methods=["POST"])
+chat_router_no_prefix.add_api_route("/models", list_models, methods=["GET"])
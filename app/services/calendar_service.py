@@ -10,20 +10,68 @@ Setup:
 4. Set GOOGLE_CALENDAR_ID and GOOGLE_SERVICE_ACCOUNT_FILE in .env
 """
 
+import asyncio
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import google_auth_httplib2
+import orjson
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 
 logger = logging.getLogger(__name__)
 
 # Google Calendar API scopes
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Seconds a fetched busy list is reused by find_available_slots
+BUSY_CACHE_TTL = 30.0
+
+# Worker threads for fanning out independent Calendar API calls
+_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='calendar')
+
+# Events requested per events.list page (the API maximum is 2500)
+EVENTS_PAGE_SIZE = 250
+
+# Maximum sub-requests Google accepts in one Calendar batch request
+BATCH_LIMIT = 50
+
+
+class FreeBusyError(Exception):
+    """A freebusy.query response reported errors for the queried calendar."""
+
+
+def _normalize(period: Dict[str, str]) -> Tuple[int, int]:
+    """Convert a freebusy period into (start, end) POSIX seconds.
+
+    The API uses a "Z" suffix for UTC, which fromisoformat only accepts from
+    Python 3.11 on.
+    """
+    start = datetime.fromisoformat(period['start'].replace('Z', '+00:00'))
+    end = datetime.fromisoformat(period['end'].replace('Z', '+00:00'))
+    return int(start.timestamp()), int(end.timestamp())
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses API responses with orjson instead of json."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
 
 class GoogleCalendarService:
     """Service for managing appointments via Google Calendar API."""
@@ -58,6 +106,11 @@ class GoogleCalendarService:
         if not self.service_account_file:
             raise ValueError("GOOGLE_SERVICE_ACCOUNT_FILE environment variable not set")
         
+        # httplib2.Http is not thread-safe; each thread gets its own
+        # authorized transport (see _http)
+        self._local = threading.local()
+        # (calendar_id, timeMin, timeMax) -> (fetched_at, busy intervals)
+        self._busy_cache: Dict[Tuple[str, str, str], Tuple[float, List]] = {}
         self.service = self._authenticate()
         logger.info(f"✅ Google Calendar service initialized for {self.calendar_id}")
 
@@ -70,17 +123,37 @@ class GoogleCalendarService:
             Authenticated Google Calendar API service
         """
         try:
-            creds = service_account.Credentials.from_service_account_file(
+            self.credentials = service_account.Credentials.from_service_account_file(
                 self.service_account_file,
                 scopes=SCOPES
             )
-            service = build('calendar', 'v3', credentials=creds)
+            # Use the discovery document bundled with the client library
+            # instead of fetching it over HTTP
+            service = build(
+                'calendar',
+                'v3',
+                credentials=self.credentials,
+                model=_OrjsonModel(),
+                cache_discovery=False,
+                static_discovery=True
+            )
             logger.info("✅ Successfully authenticated with Google Calendar API")
             return service
         except Exception as e:
             logger.error(f"❌ Failed to authenticate with Google Calendar: {e}")
             raise
 
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return the authorized HTTP transport for the calling thread."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            # build_http() matches what build(credentials=...) uses: a socket
+            # timeout (a bare httplib2.Http() has none and can block forever)
+            # and no 308 redirect handling
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=build_http())
+            self._local.http = http
+        return http
+
     def find_available_slots(
         self,
         start_date: datetime,
@@ -120,22 +193,13 @@ class GoogleCalendarService:
             # Get existing events in date range
             logger.info(f"🔍 Searching for available slots from {start_date} to {end_date}")
             
-            events_result = self.service.events().list(
-                calendarId=self.calendar_id,
-                timeMin=start_date.isoformat(),
-                timeMax=end_date.isoformat(),
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            existing_events = events_result.get('items', [])
-            logger.info(f"📅 Found {len(existing_events)} existing events")
+            busy = self._get_busy(start_date, end_date)
 
             # Generate potential time slots
             available_slots = self._generate_available_slots(
                 start_date,
                 end_date,
-                existing_events,
+                busy,
                 duration_minutes,
                 buffer_minutes,
                 business_hours
@@ -144,82 +208,166 @@ class GoogleCalendarService:
             logger.info(f"✅ Found {len(available_slots)} available slots")
             return available_slots
 
-        except HttpError as e:
+        except (HttpError, FreeBusyError) as e:
             logger.error(f"❌ Calendar API error: {e}")
             return []
         except Exception as e:
             logger.error(f"❌ Unexpected error finding slots: {e}")
             return []
 
+    def find_available_slots_multi(
+        self,
+        windows: List[Tuple[datetime, datetime]],
+        **kwargs
+    ) -> List[List[Dict[str, Any]]]:
+        """Find available slots for several date ranges concurrently.
+
+        Parameters
+        ----------
+        windows : List[Tuple[datetime, datetime]]
+            (start_date, end_date) ranges to search
+        **kwargs
+            Passed through to ``find_available_slots``
+
+        Returns
+        -------
+        List[List[Dict]]
+            Available slots for each window, in input order
+        """
+        futures = [
+            _pool.submit(self.find_available_slots, start, end, **kwargs)
+            for start, end in windows
+        ]
+        return [future.result() for future in futures]
+
+    def _get_busy(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Tuple[int, int]]:
+        """Return busy (start, end) epoch intervals in the range, sorted by start.
+
+        Results are cached for ``BUSY_CACHE_TTL`` seconds per range, so
+        repeated availability checks during a call skip the API round-trip.
+        Bookings, cancellations and reschedules clear the cache.
+        """
+        key = (self.calendar_id, start_date.isoformat(), end_date.isoformat())
+        now = time.monotonic()
+        cached = self._busy_cache.get(key)
+        if cached is not None and now - cached[0] < BUSY_CACHE_TTL:
+            return cached[1]
+
+        # freebusy.query returns only the busy intervals, not full event
+        # payloads; find_appointments_by_phone still needs events.list
+        freebusy_result = self.service.freebusy().query(
+            body={
+                'timeMin': key[1],
+                'timeMax': key[2],
+                'timeZone': self.timezone,
+                'items': [{'id': self.calendar_id}],
+            }
+        ).execute(http=self._http())
+
+        calendar = freebusy_result.get('calendars', {}).get(self.calendar_id)
+        if calendar is None or calendar.get('errors'):
+            # Per-calendar failures (not shared with the service account,
+            # unknown id, ...) come back as HTTP 200 with an empty busy list;
+            # treating them as a free calendar would offer every slot
+            errors = calendar.get('errors') if calendar else 'calendar missing from response'
+            raise FreeBusyError(f"freebusy lookup failed for {self.calendar_id}: {errors}")
+
+        periods = calendar.get('busy', [])
+        logger.info(f"📅 Found {len(periods)} busy periods")
+
+        # Normalize each period once, sorted by start so slot generation can
+        # sweep through them in order
+        busy = sorted(map(_normalize, periods))
+
+        # Drop expired ranges so the cache stays bounded
+        for stale_key, (fetched_at, _) in list(self._busy_cache.items()):
+            if now - fetched_at >= BUSY_CACHE_TTL:
+                self._busy_cache.pop(stale_key, None)
+        self._busy_cache[key] = (now, busy)
+        return busy
+
     def _generate_available_slots(
         self,
         start_date: datetime,
         end_date: datetime,
-        existing_events: List[Dict],
+        busy: List[Tuple[int, int]],
         duration_minutes: int,
         buffer_minutes: int,
         business_hours: Dict
     ) -> List[Dict[str, Any]]:
         """Generate list of available time slots.
 
+        ``busy`` holds (start, end) POSIX seconds sorted by start. Candidate
+        slots are produced in chronological order, so a single pointer sweeps
+        through the busy intervals instead of rescanning every event for each
+        slot. Slots are enumerated as integer epochs; a datetime is only
+        built for slots that are emitted.
+
         This is a simplified implementation. In production, you'd want more
         sophisticated slot generation considering holidays, breaks, etc.
         """
         available_slots = []
+        i = 0
+        n_busy = len(busy)
         current_date = start_date.date()
         end_date_only = end_date.date()
 
+        # Loop invariants: business hours, the time of the search and the
+        # slot/step/day increments are the same for every day and slot
+        start_hour, start_min = map(int, business_hours['start'].split(':'))
+        end_hour, end_min = map(int, business_hours['end'].split(':'))
+        open_time = datetime.min.time().replace(hour=start_hour, minute=start_min)
+        close_time = datetime.min.time().replace(hour=end_hour, minute=end_min)
+        business_days = business_hours['days']
+        now = time.time()
+        duration_sec = duration_minutes * 60
+        step_sec = (duration_minutes + buffer_minutes) * 60
+        one_day = timedelta(days=1)
+
         while current_date <= end_date_only:
             # Check if this day is a business day
-            if current_date.weekday() not in business_hours['days']:
-                current_date += timedelta(days=1)
+            if current_date.weekday() not in business_days:
+                current_date += one_day
                 continue
 
-            # Parse business hours for this day
-            start_hour, start_min = map(int, business_hours['start'].split(':'))
-            end_hour, end_min = map(int, business_hours['end'].split(':'))
+            day_start = int(datetime.combine(current_date, open_time).timestamp())
+            day_end = int(datetime.combine(current_date, close_time).timestamp())
 
-            day_start = datetime.combine(
-                current_date,
-                datetime.min.time().replace(hour=start_hour, minute=start_min)
-            )
-            day_end = datetime.combine(
-                current_date,
-                datetime.min.time().replace(hour=end_hour, minute=end_min)
-            )
+            # Start at the first slot after now, so past slots are never
+            # checked against the busy list
+            first_slot = day_start
+            if now >= day_start:
+                first_slot += (int(now - day_start) // step_sec + 1) * step_sec
 
             # Generate slots for this day
-            current_slot = day_start
-            while current_slot + timedelta(minutes=duration_minutes) <= day_end:
-                slot_end = current_slot + timedelta(minutes=duration_minutes)
-
-                # Check if slot conflicts with existing events
-                is_available = True
-                for event in existing_events:
-                    event_start = datetime.fromisoformat(
-                        event['start'].get('dateTime', event['start'].get('date'))
-                    )
-                    event_end = datetime.fromisoformat(
-                        event['end'].get('dateTime', event['end'].get('date'))
-                    )
-
-                    # Check for overlap (with buffer)
-                    if not (slot_end <= event_start or current_slot >= event_end):
-                        is_available = False
-                        break
-
-                if is_available and current_slot > datetime.now():
+            for slot_start in range(first_slot, day_end - duration_sec + 1, step_sec):
+                slot_end = slot_start + duration_sec
+
+                # Skip busy intervals that end before this slot starts; they
+                # cannot overlap this or any later slot
+                while i < n_busy and busy[i][1] <= slot_start:
+                    i += 1
+
+                # The next remaining interval overlaps iff it starts before
+                # the slot ends (later ones start no earlier)
+                if i == n_busy or busy[i][0] >= slot_end:
+                    current_slot = datetime.fromtimestamp(slot_start)
+                    # One strftime call for all three display fields
+                    slot_date, day_label, slot_time = current_slot.strftime(
+                        '%Y-%m-%d|%A, %B %d|%I:%M %p'
+                    ).split('|')
                     available_slots.append({
                         'datetime': current_slot.isoformat(),
-                        'display': current_slot.strftime('%A, %B %d at %I:%M %p'),
-                        'date': current_slot.strftime('%Y-%m-%d'),
-                        'time': current_slot.strftime('%I:%M %p')
+                        'display': f'{day_label} at {slot_time}',
+                        'date': slot_date,
+                        'time': slot_time
                     })
 
-                # Move to next slot (including buffer)
-                current_slot += timedelta(minutes=duration_minutes + buffer_minutes)
-
-            current_date += timedelta(days=1)
+            current_date += one_day
 
         return available_slots
 
@@ -298,8 +446,9 @@ Booked via AI Assistant on {datetime.now().strftime('%Y-%m-%d at %I:%M %p')}
                 calendarId=self.calendar_id,
                 body=event,
                 sendNotifications=True
-            ).execute()
+            ).execute(http=self._http())
 
+            self._busy_cache.clear()
             logger.info(f"✅ Appointment created: {created_event['id']}")
 
             return {
@@ -338,6 +487,94 @@ Booked via AI Assistant on {datetime.now().strftime('%Y-%m-%d at %I:%M %p')}
                 'error': 'An unexpected error occurred while booking.'
             }
 
+    def create_events_batch(
+        self,
+        events: List[Dict[str, Any]],
+        send_notifications: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Create several calendar events using batched API requests.
+
+        Parameters
+        ----------
+        events : List[Dict]
+            Event bodies, in the same shape ``create_event`` sends
+        send_notifications : bool
+            Whether to send notifications for the created events
+
+        Returns
+        -------
+        List[Dict]
+            One result per input event, in input order, with success status
+            and either the event_id or an error message
+        """
+        results: List[Dict[str, Any]] = [{} for _ in events]
+
+        def on_response(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                logger.error(f"❌ Batch insert {index} failed: {exception}")
+                results[index] = {
+                    'success': False,
+                    'error': 'Unable to book appointment. Please try again.'
+                }
+            else:
+                results[index] = {
+                    'success': True,
+                    'event_id': response['id'],
+                    'event_link': response.get('htmlLink'),
+                }
+
+        logger.info(f"📅 Creating {len(events)} appointments in batches")
+
+        # Each HTTP round-trip carries up to BATCH_LIMIT sub-requests
+        for offset in range(0, len(events), BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for index in range(offset, min(offset + BATCH_LIMIT, len(events))):
+                batch.add(
+                    self.service.events().insert(
+                        calendarId=self.calendar_id,
+                        body=events[index],
+                        sendNotifications=send_notifications
+                    ),
+                    request_id=str(index)
+                )
+            try:
+                batch.execute(http=self._http())
+            except Exception as e:
+                logger.error(f"❌ Batch request failed: {e}")
+                for index in range(offset, min(offset + BATCH_LIMIT, len(events))):
+                    if not results[index]:
+                        results[index] = {
+                            'success': False,
+                            'error': 'Unable to book appointment. Please try again.'
+                        }
+
+        self._busy_cache.clear()
+        return results
+
+    def _iter_events(self, time_min: str, time_max: str, **filters):
+        """Yield events in the range, following ``nextPageToken`` across pages.
+
+        ``events.list`` returns at most ``maxResults`` events per response, so
+        a single call silently truncates busy calendars.
+        """
+        page_token = None
+        while True:
+            result = self.service.events().list(
+                calendarId=self.calendar_id,
+                timeMin=time_min,
+                timeMax=time_max,
+                singleEvents=True,
+                orderBy='startTime',
+                maxResults=EVENTS_PAGE_SIZE,
+                pageToken=page_token,
+                **filters
+            ).execute(http=self._http())
+            yield from result.get('items', [])
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                return
+
     def find_appointments_by_phone(
         self,
         phone_number: str,
@@ -363,16 +600,11 @@ Booked via AI Assistant on {datetime.now().strftime('%Y-%m-%d at %I:%M %p')}
 
             logger.info(f"🔍 Searching for appointments for {phone_number}")
 
-            events = self.service.events().list(
-                calendarId=self.calendar_id,
-                timeMin=now.isoformat(),
-                timeMax=future.isoformat(),
-                privateExtendedProperty=f'customer_phone={phone_number}',
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            appointments = events.get('items', [])
+            appointments = list(self._iter_events(
+                now.isoformat(),
+                future.isoformat(),
+                privateExtendedProperty=f'customer_phone={phone_number}'
+            ))
             logger.info(f"📅 Found {len(appointments)} appointments for {phone_number}")
 
             return appointments
@@ -407,8 +639,9 @@ Booked via AI Assistant on {datetime.now().strftime('%Y-%m-%d at %I:%M %p')}
                 calendarId=self.calendar_id,
                 eventId=event_id,
                 sendNotifications=send_notifications
-            ).execute()
+            ).execute(http=self._http())
 
+            self._busy_cache.clear()
             logger.info(f"✅ Appointment cancelled: {event_id}")
 
             return {
@@ -452,7 +685,7 @@ Booked via AI Assistant on {datetime.now().strftime('%Y-%m-%d at %I:%M %p')}
             event = self.service.events().get(
                 calendarId=self.calendar_id,
                 eventId=event_id
-            ).execute()
+            ).execute(http=self._http())
 
             # Update times
             end_time = new_start_time + timedelta(minutes=duration_minutes)
@@ -465,8 +698,9 @@ Booked via AI Assistant on {datetime.now().strftime('%Y-%m-%d at %I:%M %p')}
                 eventId=event_id,
                 body=event,
                 sendNotifications=True
-            ).execute()
+            ).execute(http=self._http())
 
+            self._busy_cache.clear()
             logger.info(f"✅ Appointment rescheduled: {event_id}")
 
             return {
@@ -483,6 +717,49 @@ Booked via AI Assistant on {datetime.now().strftime('%Y-%m-%d at %I:%M %p')}
                 'error': 'Unable to reschedule appointment. Please try again.'
             }
 
+    # Async variants for use from the event loop. The Google client is
+    # blocking, so each call runs in a worker thread via asyncio.to_thread.
+
+    async def find_available_slots_async(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of ``find_available_slots``."""
+        return await asyncio.to_thread(self.find_available_slots, *args, **kwargs)
+
+    async def create_event_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of ``create_event``."""
+        return await asyncio.to_thread(self.create_event, *args, **kwargs)
+
+    async def find_appointments_by_phone_async(self, *args, **kwargs) -> List[Dict]:
+        """Async variant of ``find_appointments_by_phone``."""
+        return await asyncio.to_thread(self.find_appointments_by_phone, *args, **kwargs)
+
+    async def cancel_appointment_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of ``cancel_appointment``."""
+        return await asyncio.to_thread(self.cancel_appointment, *args, **kwargs)
+
+    async def reschedule_appointment_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async variant of ``reschedule_appointment``."""
+        return await asyncio.to_thread(self.reschedule_appointment, *args, **kwargs)
+
+
+_calendar_service: Optional[GoogleCalendarService] = None
+_calendar_service_lock = threading.Lock()
+
+
+def get_calendar_service() -> GoogleCalendarService:
+    """Return the process-wide calendar service, created on first use.
+
+    Construction reads the service account key and builds the API client, so
+    it is done once per process rather than per request. The lock makes sure
+    concurrent first calls (from ``_pool`` or ``asyncio.to_thread``) share one
+    instance, and with it one busy cache.
+    """
+    global _calendar_service
+    if _calendar_service is None:
+        with _calendar_service_lock:
+            if _calendar_service is None:
+                _calendar_service = GoogleCalendarService()
+    return _calendar_service
+
 
 # TODO: Add these when ready
 # - Business hours validation
@@ -4,10 +4,12 @@ This module loads and manages customer-specific personas that define
 the AI assistant's personality, tone, capabilities, and conversation flow.
 """
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
-from app.core.config import settings
+# Persona placeholders look like "[Business Name]" or "[Current Date]"
+_PH = re.compile(r"\[([A-Za-z _]+)\]")
 
 
 class PersonaManager:
@@ -24,6 +26,18 @@ class PersonaManager:
         if personas_dir is None:
             personas_dir = Path(__file__).parent.parent / "personas"
         self.personas_dir = personas_dir
+        # Persona file path -> (st_mtime_ns, text), refreshed when the file changes
+        self._cache: dict[Path, tuple[int, str]] = {}
+        # (personas_dir st_mtime_ns, persona names); adding, removing or
+        # renaming a file bumps the directory mtime
+        self._listing_cache: Optional[tuple[int, list[str]]] = None
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[os.stat_result]:
+        try:
+            return path.stat()
+        except OSError:
+            return None
 
     def load_persona(self, persona_name: str = "default") -> str:
         """Load a persona by name.
@@ -45,20 +59,29 @@ class PersonaManager:
             If the persona file doesn't exist.
         """
         persona_file = self.personas_dir / f"{persona_name}.txt"
+        st = self._stat(persona_file)
 
-        if not persona_file.exists():
+        if st is None:
             # Fall back to default if specified persona doesn't exist
             if persona_name != "default":
                 print(f"Warning: Persona '{persona_name}' not found. Using default.")
                 persona_file = self.personas_dir / "default.txt"
+                st = self._stat(persona_file)
 
-        if not persona_file.exists():
+        if st is None:
             raise FileNotFoundError(
                 f"Persona file not found: {persona_file}. "
                 "Please create at least a default.txt persona."
             )
 
-        return persona_file.read_text(encoding="utf-8")
+        # A single stat per call; the file is only re-read after it changes
+        cached = self._cache.get(persona_file)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+
+        text = persona_file.read_text(encoding="utf-8")
+        self._cache[persona_file] = (st.st_mtime_ns, text)
+        return text
 
     def inject_business_context(
         self,
@@ -82,18 +105,26 @@ class PersonaManager:
         str
             Persona text with business context injected.
         """
-        result = persona_text
-
-        # Replace business name placeholder
+        # Placeholders are filled from business_info (keys title-cased, e.g.
+        # current_date -> [Current Date]) and business_name, in one pass
+        mapping = {
+            key.replace("_", " ").title(): str(value)
+            for key, value in (business_info or {}).items()
+        }
         if business_name:
-            result = result.replace("[Business Name]", business_name)
+            mapping["Business Name"] = business_name
+
+        result = persona_text
+        if mapping:
+            result = _PH.sub(lambda m: mapping.get(m.group(1), m.group(0)), result)
 
         # Inject additional business context if provided
         if business_info:
-            context_section = "\n\n## Business Context (Current Session)\n"
-            for key, value in business_info.items():
-                context_section += f"- **{key.replace('_', ' ').title()}**: {value}\n"
-            result += context_section
+            lines = "".join(
+                f"- **{key.replace('_', ' ').title()}**: {value}\n"
+                for key, value in business_info.items()
+            )
+            result = f"{result}\n\n## Business Context (Current Session)\n{lines}"
 
         return result
 
@@ -132,12 +163,23 @@ class PersonaManager:
         list[str]
             List of persona names (without .txt extension).
         """
-        if not self.personas_dir.exists():
+        st = self._stat(self.personas_dir)
+        if st is None:
             return []
 
-        return [
-            f.stem for f in self.personas_dir.glob("*.txt") if f.is_file()
-        ]
+        cached = self._listing_cache
+        if cached is None or cached[0] != st.st_mtime_ns:
+            with os.scandir(self.personas_dir) as entries:
+                names = [
+                    entry.name[:-4]
+                    for entry in entries
+                    if entry.name.endswith(".txt")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+            cached = self._listing_cache = (st.st_mtime_ns, names)
+
+        return list(cached[1])
 
 
 # Singleton instance
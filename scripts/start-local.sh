@@ -163,4 +163,5 @@ echo ""
 echo -e "${YELLOW}Press CTRL+C to stop the server${NC}\n"
 
 # Start uvicorn with reload for development using the venv python
-exec .venv/bin/python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+# (uvloop event loop + httptools parser, both installed by uvicorn[standard])
+exec .venv/bin/python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload --loop uvloop --http httptools
@@ -0,0 +1,108 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from googleapiclient.discovery import build  # noqa: E402
+from googleapiclient.http import HttpMockSequence  # noqa: E402
+
+from app.services import calendar_service  # noqa: E402
+from app.services.calendar_service import GoogleCalendarService  # noqa: E402
+
+CALENDAR_ID = "cal@x"
+
+
+def make_service(monkeypatch, responses):
+    http = HttpMockSequence([({"status": "200"}, orjson.dumps(body)) for body in responses])
+    api = build(
+        "calendar",
+        "v3",
+        http=http,
+        model=calendar_service._OrjsonModel(),
+        static_discovery=True,
+    )
+    monkeypatch.setattr(GoogleCalendarService, "_authenticate", lambda self: api)
+    service = GoogleCalendarService(calendar_id=CALENDAR_ID, service_account_file="unused.json")
+    monkeypatch.setattr(service, "_http", lambda: http)
+    return service
+
+
+def next_business_day() -> datetime:
+    day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day
+
+
+def test_free_calendar_offers_business_hour_slots(monkeypatch):
+    service = make_service(monkeypatch, [{"calendars": {CALENDAR_ID: {"busy": []}}}])
+    day = next_business_day()
+
+    slots = service.find_available_slots(day, day + timedelta(hours=23))
+
+    # 09:00-17:00 with 60 minute slots and a 15 minute buffer
+    assert len(slots) == 6
+
+
+def test_busy_period_blocks_overlapping_slots(monkeypatch):
+    day = next_business_day()
+    busy = {
+        "start": (day + timedelta(hours=9)).astimezone().isoformat(),
+        "end": (day + timedelta(hours=11)).astimezone().isoformat(),
+    }
+    service = make_service(monkeypatch, [{"calendars": {CALENDAR_ID: {"busy": [busy]}}}])
+
+    slots = service.find_available_slots(day, day + timedelta(hours=23))
+
+    assert [slot["time"] for slot in slots][:1] == ["11:30 AM"]
+
+
+def test_freebusy_calendar_errors_return_no_slots_and_are_not_cached(monkeypatch):
+    error = {"calendars": {CALENDAR_ID: {"errors": [{"reason": "notFound"}], "busy": []}}}
+    service = make_service(monkeypatch, [error, {"calendars": {CALENDAR_ID: {"busy": []}}}])
+    day = next_business_day()
+
+    assert service.find_available_slots(day, day + timedelta(hours=23)) == []
+    assert service._busy_cache == {}
+    # The next lookup goes back to the API instead of reusing the failure
+    assert len(service.find_available_slots(day, day + timedelta(hours=23))) == 6
+
+
+def test_get_calendar_service_builds_one_instance_across_threads(monkeypatch):
+    created = []
+
+    class SlowService:
+        def __init__(self):
+            time.sleep(0.05)
+            created.append(self)
+
+    monkeypatch.setattr(calendar_service, "GoogleCalendarService", SlowService)
+    monkeypatch.setattr(calendar_service, "_calendar_service", None)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(calendar_service.get_calendar_service()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+
+
+def test_thread_transport_has_socket_timeout(monkeypatch):
+    monkeypatch.setattr(GoogleCalendarService, "_authenticate", lambda self: None)
+    service = GoogleCalendarService(calendar_id=CALENDAR_ID, service_account_file="unused.json")
+    service.credentials = object()
+
+    transport = service._http()
+
+    assert transport.http.timeout
+    assert transport is service._http()
@@ -0,0 +1,36 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"data": {"event_type": "call.initiated", "payload": {"call_control_id": 123}}},
+        {"data": {"event_type": "call.hangup", "payload": None}},
+        {"data": {"event_type": "call.initiated", "payload": {"to": ["+15550100"]}}},
+        {"data": {"event_type": "call.ai.error", "payload": {"error_code": 42}}},
+        {"data": None},
+        {},
+    ],
+)
+def test_unexpected_shapes_are_accepted(client, payload):
+    response = client.post("/telnyx/call-control", json=payload)
+    assert response.status_code == 200
+    assert response.json()["received"] is True
+
+
+def test_invalid_payload_detail_does_not_echo_input(client):
+    response = client.post(
+        "/telnyx/call-control", json={"data": {"payload": {"call_control_id": {"x": "secret"}}}}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid payload"
+    assert "secret" not in response.text
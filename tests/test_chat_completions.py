@@ -0,0 +1,140 @@
+import logging
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import ai_voice
+
+UPSTREAM_CONTENT = "Sure, what day works for you?"
+# Non-compact JSON, so re-encoding is distinguishable from a byte passthrough
+UPSTREAM_BODY = orjson.dumps(
+    {
+        "id": "chatcmpl-upstream",
+        "object": "chat.completion",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": UPSTREAM_CONTENT},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"total_tokens": 3},
+    },
+    option=orjson.OPT_INDENT_2,
+)
+UPSTREAM_STREAM = (
+    b'data: {"id":"x","object":"chat.completion.chunk","choices":'
+    b'[{"index":0,"delta":{"content":"Sure"},"finish_reason":null}]}\n\n'
+    b"data: [DONE]\n\n"
+)
+LATER_TURN = [
+    {"role": "user", "content": "hi"},
+    {"role": "assistant", "content": "Hello!"},
+    {"role": "user", "content": "I need a haircut"},
+]
+
+
+@pytest.fixture
+def upstream_requests():
+    return []
+
+
+@pytest.fixture
+def client(monkeypatch, upstream_requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        upstream_requests.append(body)
+        if body.get("stream"):
+            return httpx.Response(
+                200, content=UPSTREAM_STREAM, headers={"content-type": "text/event-stream"}
+            )
+        return httpx.Response(
+            200, content=UPSTREAM_BODY, headers={"content-type": "application/json"}
+        )
+
+    monkeypatch.setattr(ai_voice, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(ai_voice, "PERSONA_NAME", "medical_clinic")
+    with TestClient(app) as c:
+        # Swap in the mock for the test; the lifespan closes the real client
+        real = app.state.openai
+        app.state.openai = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="https://api.openai.com"
+        )
+        yield c
+        app.state.openai = real
+
+
+def sse_events(text: str) -> list:
+    events = [line.removeprefix("data: ") for line in text.split("\n\n") if line]
+    return [event if event == "[DONE]" else orjson.loads(event) for event in events]
+
+
+def test_greeting_only(client, upstream_requests):
+    response = client.post("/v1/chat/completions", json={"messages": []})
+
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["object"] == "chat.completion"
+    assert body["choices"][0]["message"]["content"] == ai_voice.GREETING_FULL
+    assert upstream_requests == []
+
+
+def test_greeting_only_streamed(client, upstream_requests):
+    response = client.post("/v1/chat/completions", json={"stream": True, "messages": []})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    content, stop, done = sse_events(response.text)
+    assert content["object"] == "chat.completion.chunk"
+    assert content["choices"][0]["delta"]["content"] == ai_voice.GREETING_FULL
+    assert stop["choices"][0]["finish_reason"] == "stop"
+    assert done == "[DONE]"
+    assert upstream_requests == []
+
+
+def test_first_turn_prepends_greeting(client):
+    response = client.post(
+        "/v1/chat/completions", json={"messages": [{"role": "user", "content": "hi"}]}
+    )
+
+    content = response.json()["choices"][0]["message"]["content"]
+    assert content == ai_voice.GREETING_PREFIX + UPSTREAM_CONTENT
+
+
+def test_first_turn_streamed_prepends_greeting(client, upstream_requests):
+    response = client.post(
+        "/v1/chat/completions",
+        json={"stream": True, "messages": [{"role": "user", "content": "hi"}]},
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    greeting, *rest = response.content.split(b"\n\n", 1)
+    assert orjson.loads(greeting.removeprefix(b"data: "))["choices"][0]["delta"]["content"] == (
+        ai_voice.GREETING_PREFIX
+    )
+    assert rest[0] == UPSTREAM_STREAM
+    assert upstream_requests[0]["stream"] is True
+    assert len(upstream_requests[0]["tools"]) == len(ai_voice.APPOINTMENT_TOOLS)
+
+
+def test_later_turn_passes_bytes_through_when_info_is_off(client):
+    ai_voice.logger.setLevel(logging.WARNING)
+    try:
+        response = client.post("/v1/chat/completions", json={"messages": LATER_TURN})
+    finally:
+        ai_voice.logger.setLevel(logging.NOTSET)
+
+    assert response.content == UPSTREAM_BODY
+
+
+def test_later_turn_is_parsed_when_info_is_on(client):
+    ai_voice.logger.setLevel(logging.INFO)
+    try:
+        response = client.post("/v1/chat/completions", json={"messages": LATER_TURN})
+    finally:
+        ai_voice.logger.setLevel(logging.NOTSET)
+
+    assert response.content != UPSTREAM_BODY
+    assert response.json()["choices"][0]["message"]["content"] == UPSTREAM_CONTENT
@@ -0,0 +1,67 @@
+import base64
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from nacl.signing import SigningKey
+
+from app.main import app
+from app.routers import ai_voice
+
+SIGNING_KEY = SigningKey.generate()
+BODY = b'{"data":{"event_type":"call.answered","payload":{"call_control_id":"abc"}}}'
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(ai_voice, "TELNYX_VERIFY_KEY", SIGNING_KEY.verify_key)
+    with TestClient(app) as c:
+        yield c
+
+
+def signed_headers(body: bytes, timestamp: int | None = None) -> dict[str, str]:
+    ts = str(int(time.time()) if timestamp is None else timestamp)
+    signature = SIGNING_KEY.sign(ts.encode() + b"|" + body).signature
+    return {
+        "telnyx-signature-ed25519": base64.b64encode(signature).decode(),
+        "telnyx-timestamp": ts,
+        "content-type": "application/json",
+    }
+
+
+def test_valid_signature_is_accepted(client):
+    response = client.post("/telnyx/call-control", content=BODY, headers=signed_headers(BODY))
+    assert response.status_code == 200
+
+
+def test_tampered_body_is_rejected(client):
+    headers = signed_headers(BODY)
+    response = client.post("/telnyx/call-control", content=BODY + b" ", headers=headers)
+    assert response.status_code == 401
+
+
+def test_signature_from_other_key_is_rejected(client):
+    ts = str(int(time.time()))
+    signature = SigningKey.generate().sign(ts.encode() + b"|" + BODY).signature
+    headers = {
+        "telnyx-signature-ed25519": base64.b64encode(signature).decode(),
+        "telnyx-timestamp": ts,
+    }
+    assert client.post("/telnyx/call-control", content=BODY, headers=headers).status_code == 401
+
+
+def test_stale_timestamp_is_rejected(client):
+    headers = signed_headers(BODY, timestamp=int(time.time()) - 3600)
+    assert client.post("/telnyx/call-control", content=BODY, headers=headers).status_code == 401
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"telnyx-timestamp": "not-a-number", "telnyx-signature-ed25519": "AAAA"},
+        {"telnyx-timestamp": str(int(time.time())), "telnyx-signature-ed25519": "%%%"},
+    ],
+)
+def test_missing_or_malformed_headers_are_rejected(client, headers):
+    assert client.post("/telnyx/call-control", content=BODY, headers=headers).status_code == 401